@@ -12,7 +12,7 @@ from .spec import (
     serialize_instruction, serialize_program,
     deserialize_instruction, deserialize_program,
     # VM State & Execution
-    VMState, execute, execute_program, execute_bytecode,
+    VMState, execute, execute_copy, execute_program, execute_bytecode, execute_bytes,
 )
 
 from .registry import (
@@ -27,6 +27,7 @@ from .fuzzing.expression import (
     compile_expr_to_instructions,
     compile_expr,
     random_expr,
+    random_expr_bytecode,
 )
 
 __version__ = "0.1.0"
@@ -4,6 +4,7 @@ from .fuzzer import (
     ExecutionResult, Success, ExceptionThrown, Crash,
     FuzzingStatistics,
     run_fuzzer,
+    run_fuzzer_all,
 )
 
 from .expression import (
@@ -12,4 +13,5 @@ from .expression import (
     compile_expr_to_instructions,
     compile_expr,
     random_expr,
+    random_expr_bytecode,
 )
@@ -7,11 +7,12 @@ enumeration provides guaranteed coverage of the bounded model.
 """
 
 import itertools
+import struct
 from typing import Iterator, List
 
 from sloppyvm.spec import (
-    PUSH4, ADD, MUL, BYTE,
-    serialize_program
+    ADD, MUL, BYTE,
+    OP_PUSH4, OP_ADD, OP_MUL, OP_BYTE
 )
 from .expression import Expr, Const, Add, Mul, Byte, compile_expr
 
@@ -100,6 +101,13 @@ def enumerate_expression_programs(max_depth: int,
 # Boundary Value Tests
 # ============================================================
 
+# The boundary tests have fixed layouts, so they are packed directly
+# instead of going through PUSH4/serialize_program:
+#   PUSH4 a; PUSH4 b; op   and   PUSH4 a; op
+_pack_binary_op = struct.Struct('>BIBIB').pack
+_pack_unary_op = struct.Struct('>BIB').pack
+
+
 def enumerate_byte_boundary_tests() -> Iterator[bytes]:
     """
     Enumerate all critical test cases for BYTE instruction.
@@ -118,11 +126,7 @@ def enumerate_byte_boundary_tests() -> Iterator[bytes]:
         for index in test_indices:
             # Generate: PUSH4(value), PUSH4(index), BYTE
             # Note: value might be > UINT32_MAX, will be truncated by PUSH4
-            yield serialize_program([
-                PUSH4(value & 0xFFFFFFFF),
-                PUSH4(index),
-                BYTE()
-            ])
+            yield _pack_binary_op(OP_PUSH4, value & 0xFFFFFFFF, OP_PUSH4, index, OP_BYTE)
 
 
 def enumerate_arithmetic_overflow_tests() -> Iterator[bytes]:
@@ -140,20 +144,12 @@ def enumerate_arithmetic_overflow_tests() -> Iterator[bytes]:
     # Test ADD overflow
     for v1 in large_values:
         for v2 in large_values:
-            yield serialize_program([
-                PUSH4(v1),
-                PUSH4(v2),
-                ADD()
-            ])
+            yield _pack_binary_op(OP_PUSH4, v1, OP_PUSH4, v2, OP_ADD)
 
     # Test MUL overflow
     for v1 in large_values:
         for v2 in large_values:
-            yield serialize_program([
-                PUSH4(v1),
-                PUSH4(v2),
-                MUL()
-            ])
+            yield _pack_binary_op(OP_PUSH4, v1, OP_PUSH4, v2, OP_MUL)
 
 
 def enumerate_stack_underflow_tests() -> Iterator[bytes]:
@@ -164,15 +160,15 @@ def enumerate_stack_underflow_tests() -> Iterator[bytes]:
         Bytecode that should raise StackUnderflow exception
     """
     # Operations without sufficient stack values
-    yield serialize_program([ADD()])
-    yield serialize_program([MUL()])
-    yield serialize_program([BYTE()])
+    yield bytes((OP_ADD,))
+    yield bytes((OP_MUL,))
+    yield bytes((OP_BYTE,))
 
     # One value, but need two
     for value in MINIMAL_CONSTANTS:
-        yield serialize_program([PUSH4(value), ADD()])
-        yield serialize_program([PUSH4(value), MUL()])
-        yield serialize_program([PUSH4(value), BYTE()])
+        yield _pack_unary_op(OP_PUSH4, value, OP_ADD)
+        yield _pack_unary_op(OP_PUSH4, value, OP_MUL)
+        yield _pack_unary_op(OP_PUSH4, value, OP_BYTE)
 
 
 # ============================================================
@@ -192,31 +188,17 @@ def generate_comprehensive_suite(max_expr_depth: int = 2) -> Iterator[bytes]:
     Yields:
         Bytecode for comprehensive test suite (deduplicated)
     """
-    seen = set()
-
-    # All expression programs up to max depth
-    for bytecode in enumerate_expression_programs(max_depth=max_expr_depth,
-                                                 constants=BOUNDARY_CONSTANTS):
-        hex_code = bytecode.hex()
-        if hex_code not in seen:
-            seen.add(hex_code)
-            yield bytecode
-
-    # All boundary tests (deduplicated)
-    for bytecode in enumerate_byte_boundary_tests():
-        hex_code = bytecode.hex()
-        if hex_code not in seen:
-            seen.add(hex_code)
-            yield bytecode
-
-    for bytecode in enumerate_arithmetic_overflow_tests():
-        hex_code = bytecode.hex()
-        if hex_code not in seen:
-            seen.add(hex_code)
-            yield bytecode
-
-    for bytecode in enumerate_stack_underflow_tests():
-        hex_code = bytecode.hex()
-        if hex_code not in seen:
-            seen.add(hex_code)
+    # Raw bytes are hashable, so they serve directly as set keys
+    seen: set[bytes] = set()
+
+    for bytecode in itertools.chain(
+        # All expression programs up to max depth
+        enumerate_expression_programs(max_depth=max_expr_depth, constants=BOUNDARY_CONSTANTS),
+        # All boundary tests (deduplicated)
+        enumerate_byte_boundary_tests(),
+        enumerate_arithmetic_overflow_tests(),
+        enumerate_stack_underflow_tests(),
+    ):
+        if bytecode not in seen:
+            seen.add(bytecode)
             yield bytecode
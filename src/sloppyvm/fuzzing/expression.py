@@ -2,7 +2,10 @@
 from __future__ import annotations
 from dataclasses import dataclass
 import random
-from sloppyvm.spec import serialize_program, Instruction
+import struct
+from sloppyvm.spec import (
+    serialize_program, Instruction, PUSH4, ADD, MUL, BYTE, OP_PUSH4, OP_ADD, OP_MUL, OP_BYTE
+)
 from typing import Union, List, Callable
 
 
@@ -14,7 +17,11 @@ def _default_const_generator() -> int:
     return random.randint(0, UINT32_MAX)
 
 
-@dataclass(frozen=True)
+# Nodes are frozen and slotted, like the spec's instruction classes. The
+# generated __hash__ would only hash the fields, giving e.g. Add(x, y) and
+# Mul(x, y) the same hash, so each node type includes itself in its hash.
+
+@dataclass(frozen=True, slots=True)
 class Const:
     """A 32-bit unsigned constant."""
     value: int
@@ -25,27 +32,39 @@ class Const:
         if self.value < 0 or self.value > UINT32_MAX:
             raise ValueError(f"Const value must be in [0, {UINT32_MAX}], got {self.value}")
 
+    def __hash__(self) -> int:
+        return hash((Const, self.value))
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Add:
     """Sum of two expressions."""
     left: Expr
     right: Expr
 
+    def __hash__(self) -> int:
+        return hash((Add, self.left, self.right))
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Mul:
     """Product of two expressions."""
     left: Expr
     right: Expr
 
+    def __hash__(self) -> int:
+        return hash((Mul, self.left, self.right))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Byte:
     """Extract a byte from a 64-bit value at specified index."""
     value: Expr
     index: Expr
 
+    def __hash__(self) -> int:
+        return hash((Byte, self.value, self.index))
+
 
 # Expression is a union of the four variants
 Expr = Union[Const, Add, Mul, Byte]
@@ -62,25 +81,37 @@ def compile_expr_to_instructions(expr: Expr) -> List[Instruction]:
     Uses post-order traversal: compile left operand, compile right operand,
     then emit the operation. For constants, emit PUSH4 directly.
 
+    The traversal is iterative: a worklist holds pending subexpressions and
+    the operation instructions to emit once both operands are done, and all
+    instructions are appended to a single output list.
+
     Examples:
         Const(5)           -> [PUSH4(5)]
         Add(Const(3), Const(4)) -> [PUSH4(3), PUSH4(4), ADD()]
         Mul(Const(2), Add(Const(3), Const(4))) -> [PUSH4(2), PUSH4(3), PUSH4(4), ADD(), MUL()]
         Byte(Const(0x123456789ABCDEF0), Const(1)) -> [PUSH4(...), PUSH4(1), BYTE()]
     """
-    from sloppyvm.spec import PUSH4, ADD, MUL, BYTE
-
-    match expr:
-        case Const(value=val):
-            return [PUSH4(val)]
-        case Add(left=left, right=right):
-            return compile_expr_to_instructions(left) + compile_expr_to_instructions(right) + [ADD()]
-        case Mul(left=left, right=right):
-            return compile_expr_to_instructions(left) + compile_expr_to_instructions(right) + [MUL()]
-        case Byte(value=value, index=index):
-            return compile_expr_to_instructions(value) + compile_expr_to_instructions(index) + [BYTE()]
-        case _:
-            raise ValueError(f"Unknown expression type: {expr}")
+    out: List[Instruction] = []
+    worklist: List[Union[Expr, Instruction]] = [expr]
+
+    while worklist:
+        item = worklist.pop()
+        match item:
+            case Const(value=val):
+                out.append(PUSH4(val))
+            case Add(left=left, right=right):
+                # Pushed in reverse: left is compiled first, the op emitted last
+                worklist += (ADD(), right, left)
+            case Mul(left=left, right=right):
+                worklist += (MUL(), right, left)
+            case Byte(value=value, index=index):
+                worklist += (BYTE(), index, value)
+            case ADD() | MUL() | BYTE():
+                out.append(item)
+            case _:
+                raise ValueError(f"Unknown expression type: {item}")
+
+    return out
 
 
 def compile_expr(expr: Expr) -> bytes:
@@ -92,6 +123,13 @@ def compile_expr(expr: Expr) -> bytes:
 # Random Expression Generation
 # =============================================================================
 
+# Cumulative thresholds for the node kind drawn at each level (Const 40%,
+# Add 25%, Mul 25%, Byte 10%). Shared by random_expr and
+# random_expr_bytecode, which must make identical choices.
+_CONST_CUTOFF = 0.4
+_ADD_CUTOFF = 0.65
+_MUL_CUTOFF = 0.9
+
 
 def random_expr(max_depth: int = 3, const_generator: Callable[[], int] = _default_const_generator) -> Expr:
     """
@@ -118,16 +156,16 @@ def random_expr(max_depth: int = 3, const_generator: Callable[[], int] = _defaul
 
     choice = random.random()
 
-    if choice < 0.4:
+    if choice < _CONST_CUTOFF:
         # Generate a constant
         return Const(const_generator())
-    elif choice < 0.65:
+    elif choice < _ADD_CUTOFF:
         # Generate addition
         return Add(
             random_expr(max_depth - 1, const_generator),
             random_expr(max_depth - 1, const_generator)
         )
-    elif choice < 0.9:
+    elif choice < _MUL_CUTOFF:
         # Generate multiplication
         return Mul(
             random_expr(max_depth - 1, const_generator),
@@ -139,3 +177,40 @@ def random_expr(max_depth: int = 3, const_generator: Callable[[], int] = _defaul
             random_expr(max_depth - 1, const_generator),
             random_expr(max_depth - 1, const_generator)
         )
+
+
+# Bytecode fragments for random_expr_bytecode
+_pack_push4 = struct.Struct('>BI').pack
+_ADD_BYTECODE = bytes((OP_ADD,))
+_MUL_BYTECODE = bytes((OP_MUL,))
+_BYTE_BYTECODE = bytes((OP_BYTE,))
+
+
+def random_expr_bytecode(max_depth: int = 3, const_generator: Callable[[], int] = _default_const_generator) -> bytes:
+    """
+    Generate the bytecode of a random expression without building the tree.
+
+    Makes exactly the same random choices as random_expr(), in the same
+    order, and emits the post-order bytecode directly, so
+    `random_expr_bytecode(...)` equals `compile_expr(random_expr(...))` for
+    the same random state. Use it when only the bytecode is needed.
+
+    Constants are validated by constructing a Const, raising the same errors.
+    """
+    if max_depth <= 0:
+        return _pack_push4(OP_PUSH4, Const(const_generator()).value)
+
+    choice = random.random()
+
+    if choice < _CONST_CUTOFF:
+        return _pack_push4(OP_PUSH4, Const(const_generator()).value)
+    elif choice < _ADD_CUTOFF:
+        op = _ADD_BYTECODE
+    elif choice < _MUL_CUTOFF:
+        op = _MUL_BYTECODE
+    else:
+        op = _BYTE_BYTECODE
+
+    left = random_expr_bytecode(max_depth - 1, const_generator)
+    right = random_expr_bytecode(max_depth - 1, const_generator)
+    return left + right + op
@@ -11,17 +11,22 @@ this script. Each implementation must provide a callable execute(bytecode)
 function that returns List[int].
 """
 
-from dataclasses import dataclass
+import collections
+from concurrent.futures import Executor, ProcessPoolExecutor
+import contextlib
+from dataclasses import dataclass, field
 from enum import Enum
+import functools
 import itertools
 import random
-from typing import List, Optional, Callable
+import struct
+from typing import Iterator, List, Optional, Callable, Sequence, Tuple
 
 from sloppyvm.spec import (
-    deserialize_program, execute_program, SloppyVMException, InvalidInstruction,
+    deserialize_program, execute_bytes, SloppyVMException, InvalidInstruction,
     OP_PUSH4, OP_ADD, OP_MUL, OP_BYTE
 )
-from .expression import random_expr, compile_expr, UINT32_MAX
+from .expression import random_expr_bytecode, UINT32_MAX
 from .enumeration import generate_comprehensive_suite
 from sloppyvm.registry import get_available_versions, get_implementation
 
@@ -39,12 +44,28 @@ PROB_INVALID_OPCODE = 0.03
 
 PROB_TRUNCATED_PUSH4 = 0.05
 
+# Opcodes not assigned to any instruction
+INVALID_OPCODES = (0x00, *range(0x05, 0x100))
+
 # Mixed strategy probabilities (equal weight)
 PROB_RANDOM_STRATEGY = 0.25
 PROB_STRUCTURED_STRATEGY = 0.25
 PROB_EXPRESSION_DEFAULT = 0.25
 PROB_EXPRESSION_FULL_RANGE = 0.25
 
+# Default constants for expression generation (small values plus an edge case)
+DEFAULT_CONST_VALUES = (*range(0, 10), UINT32_MAX)
+
+# Number of tests executed, compared and reported at a time; in parallel
+# runs, also the number sent to a worker process at a time
+CHUNK_SIZE = 1000
+
+# Maximum number of chunks submitted to worker processes but not yet consumed
+CHUNKS_IN_FLIGHT = 16
+
+# Encodes a whole PUSH4 instruction (opcode and big-endian operand) at once
+_pack_push4 = struct.Struct('>BI').pack
+
 
 @dataclass
 class GeneratorConfig:
@@ -70,17 +91,19 @@ class InstructionChoice(Enum):
     INVALID = "invalid"
 
 
-def choose_instruction() -> InstructionChoice:
-    """Choose instruction type based on configured probabilities."""
-    weights = [
-        (InstructionChoice.PUSH4, int(PROB_PUSH4 * 100)),
-        (InstructionChoice.ADD, int(PROB_ADD * 100)),
-        (InstructionChoice.MUL, int(PROB_MUL * 100)),
-        (InstructionChoice.BYTE, int(PROB_BYTE * 100)),
-        (InstructionChoice.INVALID, int(PROB_INVALID_OPCODE * 100)),
-    ]
-    choices, probs = zip(*weights)
-    return random.choices(choices, weights=probs)[0]
+# Instruction choices and their cumulative weights (in percent), derived once
+# from the PROB_* constants for use with random.choices(cum_weights=...)
+INSTRUCTION_CHOICES = (
+    InstructionChoice.PUSH4,
+    InstructionChoice.ADD,
+    InstructionChoice.MUL,
+    InstructionChoice.BYTE,
+    InstructionChoice.INVALID,
+)
+INSTRUCTION_CUM_WEIGHTS = tuple(itertools.accumulate(
+    int(prob * 100)
+    for prob in (PROB_PUSH4, PROB_ADD, PROB_MUL, PROB_BYTE, PROB_INVALID_OPCODE)
+))
 
 
 # =============================================================================
@@ -89,8 +112,28 @@ def choose_instruction() -> InstructionChoice:
 
 def generate_random_bytes(max_length: int = DEFAULT_CONFIG.max_length) -> bytes:
     """Generate completely random bytes - no structure consideration."""
-    length = random.randint(1, max_length)
-    return bytes(random.randint(0, 255) for _ in range(length))
+    return random.randbytes(random.randint(1, max_length))
+
+
+def generate_random_bytes_batch(count: int, max_length: int = DEFAULT_CONFIG.max_length) -> List[bytes]:
+    """
+    Generate `count` random byte sequences at once.
+
+    Same distribution as calling generate_random_bytes() `count` times, but
+    all lengths are drawn with one random.choices() call and all bytes with
+    a single randbytes() call, then sliced into variable-length test cases.
+
+    Args:
+        count: Number of byte sequences to generate
+        max_length: Maximum length of each sequence
+
+    Returns:
+        List of random byte sequences
+    """
+    lengths = random.choices(range(1, max_length + 1), k=count)
+    blob = random.randbytes(sum(lengths))
+    offsets = [0, *itertools.accumulate(lengths)]
+    return [blob[start:end] for start, end in zip(offsets, offsets[1:])]
 
 
 def generate_structure_aware_bytecode(max_instructions: int = DEFAULT_CONFIG.max_instructions) -> bytes:
@@ -107,38 +150,44 @@ def generate_structure_aware_bytecode(max_instructions: int = DEFAULT_CONFIG.max
     Returns:
         Bytecode that may or may not be valid
     """
-    instructions = []
+    buf = bytearray()
     num_instructions = random.randint(1, max_instructions)
 
-    for _ in range(num_instructions):
-        instruction_type = choose_instruction()
+    # Draw all instruction kinds up front in one call
+    instruction_types = random.choices(
+        INSTRUCTION_CHOICES, cum_weights=INSTRUCTION_CUM_WEIGHTS, k=num_instructions
+    )
 
+    for instruction_type in instruction_types:
         if instruction_type == InstructionChoice.PUSH4:
             value = random.randint(0, 0xFFFFFFFF)
             # Small chance of generating truncated PUSH4 (invalid bytecode)
             if random.random() < PROB_TRUNCATED_PUSH4:
-                value_bytes = value.to_bytes(4, 'big')
                 truncate_to = random.randint(1, 3)
-                instructions.append(bytes([OP_PUSH4]) + value_bytes[:truncate_to])
+                buf += _pack_push4(OP_PUSH4, value)[:1 + truncate_to]
                 break  # Stop generating after truncating
             else:
-                instructions.append(bytes([OP_PUSH4]) + value.to_bytes(4, 'big'))
+                buf += _pack_push4(OP_PUSH4, value)
 
         elif instruction_type == InstructionChoice.ADD:
-            instructions.append(bytes([OP_ADD]))
+            buf.append(OP_ADD)
 
         elif instruction_type == InstructionChoice.MUL:
-            instructions.append(bytes([OP_MUL]))
+            buf.append(OP_MUL)
 
         elif instruction_type == InstructionChoice.BYTE:
-            instructions.append(bytes([OP_BYTE]))
+            buf.append(OP_BYTE)
 
         elif instruction_type == InstructionChoice.INVALID:
-            invalid_opcode = random.choice([0x00] + list(range(0x05, 0x100)))
-            instructions.append(bytes([invalid_opcode]))
+            buf.append(random.choice(INVALID_OPCODES))
             break  # Stop after invalid opcode
 
-    return b''.join(instructions)
+    return bytes(buf)
+
+
+def _sample_default_const() -> int:
+    """Sample a constant from DEFAULT_CONST_VALUES."""
+    return random.choice(DEFAULT_CONST_VALUES)
 
 
 def generate_expression_bytecode(
@@ -162,16 +211,34 @@ def generate_expression_bytecode(
     """
     if max_value is None:
         # Default behavior: sample from specific values including edge cases
-        const_values = [*range(0, 10), UINT32_MAX]
-        def const_generator() -> int:
-            return random.choice(const_values)
+        const_generator = _sample_default_const
     else:
         # Generate random values in range [0, max_value]
-        def const_generator() -> int:
-            return random.randint(0, max_value)
-
-    expr = random_expr(max_depth=max_depth, const_generator=const_generator)
-    return compile_expr(expr)
+        const_generator = functools.partial(random.randint, 0, max_value)
+
+    # Emitted directly rather than via random_expr + compile_expr: same
+    # random choices and bytecode, without building and walking a tree
+    return random_expr_bytecode(max_depth=max_depth, const_generator=const_generator)
+
+
+# Mixed strategies (each taking max_instructions) and their cumulative
+# weights, derived once from the PROB_*_STRATEGY constants
+MIXED_STRATEGIES: Tuple[Callable[[int], bytes], ...] = (
+    lambda max_instructions: generate_random_bytes(),
+    lambda max_instructions: generate_structure_aware_bytecode(max_instructions=max_instructions),
+    lambda max_instructions: generate_expression_bytecode(
+        max_depth=DEFAULT_CONFIG.max_depth, max_value=None
+    ),
+    lambda max_instructions: generate_expression_bytecode(
+        max_depth=DEFAULT_CONFIG.max_depth, max_value=UINT32_MAX
+    ),
+)
+MIXED_STRATEGY_CUM_WEIGHTS = tuple(itertools.accumulate((
+    PROB_RANDOM_STRATEGY,
+    PROB_STRUCTURED_STRATEGY,
+    PROB_EXPRESSION_DEFAULT,
+    PROB_EXPRESSION_FULL_RANGE,
+)))
 
 
 def generate_mixed_strategy_bytecode(max_instructions: int = DEFAULT_CONFIG.max_instructions) -> bytes:
@@ -191,16 +258,8 @@ def generate_mixed_strategy_bytecode(max_instructions: int = DEFAULT_CONFIG.max_
     Returns:
         Bytecode generated using one of the four strategies
     """
-    strategy_roll = random.random()
-
-    if strategy_roll < PROB_RANDOM_STRATEGY:
-        return generate_random_bytes()
-    elif strategy_roll < PROB_RANDOM_STRATEGY + PROB_STRUCTURED_STRATEGY:
-        return generate_structure_aware_bytecode(max_instructions=max_instructions)
-    elif strategy_roll < PROB_RANDOM_STRATEGY + PROB_STRUCTURED_STRATEGY + PROB_EXPRESSION_DEFAULT:
-        return generate_expression_bytecode(max_depth=DEFAULT_CONFIG.max_depth, max_value=None)
-    else:
-        return generate_expression_bytecode(max_depth=DEFAULT_CONFIG.max_depth, max_value=UINT32_MAX)
+    strategy = random.choices(MIXED_STRATEGIES, cum_weights=MIXED_STRATEGY_CUM_WEIGHTS)[0]
+    return strategy(max_instructions)
 
 
 # Generator registry for dispatch (enumeration handled separately)
@@ -216,22 +275,41 @@ GENERATORS: dict[str, Callable[[], bytes]] = {
 # Execution Results
 # =============================================================================
 
-@dataclass(frozen=True)
+# Results are slotted: a run against several implementations keeps the
+# spec result of every test until all of them are checked
+
+@dataclass(frozen=True, slots=True)
 class ExecutionResult:
     """Base class for execution results - used as a union type."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExceptionThrown(ExecutionResult):
-    reason: str
+    """
+    A SloppyVM exception raised during execution.
+
+    Only the exception type takes part in comparisons. Most random bytecodes
+    raise, so the message is formatted lazily via `reason`, when a bug is
+    actually reported. The exception itself is not kept: its traceback
+    would keep every frame of the failed run alive along with the result.
+    """
+    exc_type: type
+    args: tuple = field(default=(), compare=False)
+
+    @property
+    def reason(self) -> str:
+        return repr(self.exc_type(*self.args))
 
+    def __repr__(self) -> str:
+        return f"ExceptionThrown(reason={self.reason!r})"
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Crash(ExecutionResult):
     reason: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Success(ExecutionResult):
     stack: List[int]
 
@@ -239,13 +317,9 @@ class Success(ExecutionResult):
 def execute_with_spec(bytecode: bytes) -> ExecutionResult:
     """Execute bytecode with reference implementation and return result."""
     try:
-        instructions = deserialize_program(bytecode)
-        result = execute_program(instructions)
-        return Success(result.stack)
-    except InvalidInstruction:
-        return ExceptionThrown("invalid bytecode")
+        return Success(execute_bytes(bytecode).stack)
     except SloppyVMException as e:
-        return ExceptionThrown(repr(e))
+        return ExceptionThrown(type(e), e.args)
 
 
 def execute_with_implementation(bytecode: bytes, impl_func: Callable[[bytes], List[int]]) -> ExecutionResult:
@@ -254,11 +328,77 @@ def execute_with_implementation(bytecode: bytes, impl_func: Callable[[bytes], Li
         result = impl_func(bytecode)
         return Success(result)
     except SloppyVMException as e:
-        return ExceptionThrown(repr(e))
+        return ExceptionThrown(type(e), e.args)
     except Exception as e:
         return Crash(f"implementation raised exception: {repr(e)}")
 
 
+def execute_batch_with_spec(bytecodes: Sequence[bytes]) -> List[ExecutionResult]:
+    """
+    Execute a batch of bytecodes with the reference implementation.
+
+    Each distinct bytecode is executed once; duplicates (common among short
+    random and small expression programs) share the result.
+    """
+    results = {bytecode: execute_with_spec(bytecode) for bytecode in dict.fromkeys(bytecodes)}
+    return [results[bytecode] for bytecode in bytecodes]
+
+
+def execute_batch_with_implementation(
+    bytecodes: Sequence[bytes],
+    impl_func: Callable[[bytes], List[int]]
+) -> List[ExecutionResult]:
+    """
+    Execute a batch of bytecodes with the implementation under test.
+
+    As with the spec, each distinct bytecode is executed only once.
+    """
+    results = {
+        bytecode: execute_with_implementation(bytecode, impl_func)
+        for bytecode in dict.fromkeys(bytecodes)
+    }
+    return [results[bytecode] for bytecode in bytecodes]
+
+
+def _execute_chunk_with_implementation(impl: str, bytecodes: Sequence[bytes]) -> List[ExecutionResult]:
+    """Worker entry point: looks the implementation up by name in the worker process."""
+    return execute_batch_with_implementation(bytecodes, get_implementation(impl).execute)
+
+
+def _split_into_chunks(items: Sequence) -> Iterator[Sequence]:
+    """Yield consecutive slices of CHUNK_SIZE items."""
+    for start in range(0, len(items), CHUNK_SIZE):
+        yield items[start:start + CHUNK_SIZE]
+
+
+def execute_in_chunks(
+    pool: Optional[Executor],
+    batch_func: Callable[[Sequence[bytes]], List[ExecutionResult]],
+    bytecodes: Sequence[bytes]
+) -> Iterator[List[ExecutionResult]]:
+    """
+    Run `batch_func` on consecutive chunks of CHUNK_SIZE bytecodes, yielding
+    each chunk's results in input order.
+
+    Without a pool, each chunk runs when it is requested. With a pool, chunks
+    run in its worker processes, at most CHUNKS_IN_FLIGHT at a time, so only
+    a bounded number of results is held however long the suite is.
+    """
+    chunks = _split_into_chunks(bytecodes)
+    if pool is None:
+        yield from map(batch_func, chunks)
+        return
+
+    in_flight = collections.deque(
+        pool.submit(batch_func, chunk) for chunk in itertools.islice(chunks, CHUNKS_IN_FLIGHT)
+    )
+    for chunk in chunks:
+        yield in_flight.popleft().result()
+        in_flight.append(pool.submit(batch_func, chunk))
+    while in_flight:
+        yield in_flight.popleft().result()
+
+
 def compare_results(expected: ExecutionResult, actual: ExecutionResult) -> bool:
     """
     Compare execution results for equivalence.
@@ -268,10 +408,14 @@ def compare_results(expected: ExecutionResult, actual: ExecutionResult) -> bool:
     - Exceptions match any exception (regardless of message)
     - Success only matches with identical stack values
     """
-    return (
-        type(expected) == type(actual) and
-        (not isinstance(expected, Success) or expected == actual)
-    )
+    t = type(expected)
+    if t is Success:
+        # Compare stacks directly rather than via the dataclass __eq__, which
+        # builds field tuples first; list equality checks lengths up front
+        return type(actual) is Success and expected.stack == actual.stack
+    if t is Crash or t is ExceptionThrown:
+        return type(actual) is t
+    raise TypeError(f"Unknown execution result: {expected!r}")
 
 
 # =============================================================================
@@ -300,16 +444,22 @@ class FuzzingStatistics:
 
     def record_test(self, spec_result: ExecutionResult, impl_result: ExecutionResult, results_match: bool) -> None:
         """Record results of a single test."""
-        self.total_tests += 1
-
-        if isinstance(spec_result, ExceptionThrown) and spec_result.reason == "invalid bytecode":
-            self.invalid_bytecodes += 1
-
-        if isinstance(impl_result, Crash):
-            self.crashes += 1
-
-        if not results_match:
-            self.bugs_found += 1
+        self.record_batch([spec_result], [impl_result], [results_match])
+
+    def record_batch(
+        self,
+        spec_results: Sequence[ExecutionResult],
+        impl_results: Sequence[ExecutionResult],
+        results_match: Sequence[bool]
+    ) -> None:
+        """Record results of a batch of tests, counting each category in one pass."""
+        self.total_tests += len(results_match)
+        self.invalid_bytecodes += sum(
+            1 for result in spec_results
+            if type(result) is ExceptionThrown and issubclass(result.exc_type, InvalidInstruction)
+        )
+        self.crashes += sum(1 for result in impl_results if type(result) is Crash)
+        self.bugs_found += len(results_match) - sum(results_match)
 
     def print_summary(self) -> None:
         """Print formatted summary of results."""
@@ -360,26 +510,106 @@ def print_header(num_tests: int, impl: str, generator: str) -> None:
 # Fuzzer Main Logic
 # =============================================================================
 
-def run_single_test(
-    bytecode: bytes,
-    spec_func: Callable[[bytes], ExecutionResult],
-    impl_func: Callable[[bytes], List[int]]
-) -> tuple[ExecutionResult, ExecutionResult, bool]:
+def generate_programs(
+    num_tests: Optional[int],
+    generator: str,
+    max_expr_depth: int
+) -> List[bytes]:
     """
-    Run a single fuzzing test case.
+    Generate the test suite for a fuzzing run.
 
     Args:
-        bytecode: The bytecode to test
-        spec_func: Function to execute with reference implementation
-        impl_func: Function to execute with implementation under test
+        num_tests: Number of test cases. For enumeration: None means complete suite.
+                   For other generators: defaults to 1000 if None.
+        generator: Generator type: "random", "structured", "expression", "mixed", or "enumeration"
+        max_expr_depth: Maximum expression tree depth for enumeration
 
     Returns:
-        Tuple of (spec_result, impl_result, results_match)
+        List of bytecodes
     """
-    spec_result = spec_func(bytecode)
-    impl_result = execute_with_implementation(bytecode, impl_func)
-    matches = compare_results(spec_result, impl_result)
-    return spec_result, impl_result, matches
+    if generator == "enumeration":
+        # Generate test suite (as generator)
+        suite_generator = generate_comprehensive_suite(max_expr_depth=max_expr_depth)
+
+        if num_tests is None:
+            # Run all tests
+            print(f"Generating complete enumeration suite (max expression depth: {max_expr_depth})...")
+            test_list = list(suite_generator)
+            print(f"Generated {len(test_list)} unique test cases")
+        else:
+            # Take first num_tests (lazy - only generates what we need)
+            print(f"Generating first {num_tests} enumeration tests (max expression depth: {max_expr_depth})...")
+            test_list = list(itertools.islice(suite_generator, num_tests))
+            num_generated = len(test_list)
+            if num_generated < num_tests:
+                print(f"Generated {num_generated} tests (suite exhausted)")
+            else:
+                print(f"Generated {num_generated} tests")
+                print(f"⚠️  WARNING: Running partial enumeration suite")
+                print(f"    For complete coverage, omit -n")
+
+        return test_list
+
+    # Probabilistic generators - use generator function
+    generator_func = GENERATORS.get(generator, generate_random_bytes)
+
+    # For probabilistic generators, default to 1000 tests
+    if num_tests is None:
+        num_tests = 1000
+
+    if generator_func is generate_random_bytes:
+        # Random bytes are cheapest to draw in one batch
+        return generate_random_bytes_batch(num_tests)
+    # Call generator_func num_tests times
+    return [generator_func() for _ in range(num_tests)]
+
+
+def check_implementation(
+    bytecodes: Sequence[bytes],
+    spec_results: Optional[Sequence[ExecutionResult]],
+    impl: str,
+    generator: str,
+    pool: Optional[Executor] = None
+) -> FuzzingStatistics:
+    """
+    Run a generated suite through one implementation and compare against
+    the spec, reporting every mismatch.
+
+    The suite is executed, compared and reported in chunks of CHUNK_SIZE
+    tests. If `spec_results` is None, the spec runs chunk by chunk alongside
+    the implementation; otherwise the precomputed results are used.
+
+    If `pool` is given, execution happens in its worker processes;
+    comparison and reporting always happen in the calling process.
+
+    Returns:
+        FuzzingStatistics object with results
+    """
+    stats = FuzzingStatistics()
+
+    print_header(len(bytecodes), impl, generator)
+
+    if spec_results is None:
+        spec_chunks = execute_in_chunks(pool, execute_batch_with_spec, bytecodes)
+    else:
+        spec_chunks = _split_into_chunks(spec_results)
+    impl_chunks = execute_in_chunks(
+        pool, functools.partial(_execute_chunk_with_implementation, impl), bytecodes
+    )
+
+    offset = 0
+    for spec_chunk, impl_chunk in zip(spec_chunks, impl_chunks):
+        matches = list(map(compare_results, spec_chunk, impl_chunk))
+        stats.record_batch(spec_chunk, impl_chunk, matches)
+
+        for i, match in enumerate(matches):
+            if not match:
+                report_bug(offset + i + 1, bytecodes[offset + i], spec_chunk[i], impl_chunk[i])
+        offset += len(matches)
+
+    # Print summary
+    stats.print_summary()
+    return stats
 
 
 def run_fuzzer(
@@ -387,7 +617,8 @@ def run_fuzzer(
     seed: Optional[int] = None,
     impl: str = "v1",
     generator: str = "random",
-    max_expr_depth: int = 2
+    max_expr_depth: int = 2,
+    jobs: int = 1
 ) -> FuzzingStatistics:
     """
     Run the fuzzer for a specified number of tests.
@@ -399,71 +630,68 @@ def run_fuzzer(
         impl: Which implementation to test (auto-discovered from sloppy_vm_impl_v*.py)
         generator: Generator type: "random", "structured", "expression", "mixed", or "enumeration"
         max_expr_depth: Maximum expression tree depth for enumeration (default: 2)
+        jobs: Number of worker processes used to execute the suite (default: 1)
 
     Returns:
         FuzzingStatistics object with results
     """
-    if seed is not None:
-        random.seed(seed)
+    return run_fuzzer_all(num_tests, seed, [impl], generator, max_expr_depth, jobs)[impl]
 
-    # Select implementation
-    impl_func = get_implementation(impl).execute
 
-    # Initialize statistics
-    stats = FuzzingStatistics()
+def run_fuzzer_all(
+    num_tests: Optional[int] = None,
+    seed: Optional[int] = None,
+    impls: Optional[Sequence[str]] = None,
+    generator: str = "random",
+    max_expr_depth: int = 2,
+    jobs: int = 1
+) -> dict[str, FuzzingStatistics]:
+    """
+    Run the same fuzzing suite against several implementations.
 
-    # Prepare bytecode source based on generator type
-    if generator == "enumeration":
-        # Generate test suite (as generator)
-        suite_generator = generate_comprehensive_suite(max_expr_depth=max_expr_depth)
+    The suite is generated and executed with the spec once; only the
+    implementations under test run per implementation. The spec results are
+    the only per-test results kept for the whole suite, and only when there
+    is more than one implementation to compare them against.
 
-        if num_tests is None:
-            # Run all tests
-            print(f"Generating complete enumeration suite (max expression depth: {max_expr_depth})...")
-            test_list = list(suite_generator)
-            num_tests = len(test_list)
-            print(f"Generated {num_tests} unique test cases")
-        else:
-            # Take first num_tests (lazy - only generates what we need)
-            print(f"Generating first {num_tests} enumeration tests (max expression depth: {max_expr_depth})...")
-            test_list = list(itertools.islice(suite_generator, num_tests))
-            num_generated = len(test_list)
-            if num_generated < num_tests:
-                print(f"Generated {num_generated} tests (suite exhausted)")
-                num_tests = num_generated
-            else:
-                print(f"Generated {num_generated} tests")
-                print(f"⚠️  WARNING: Running partial enumeration suite")
-                print(f"    For complete coverage, omit -n")
+    With jobs > 1, execution (spec and implementations) is spread over a
+    process pool in chunks. Generation stays in this process, so seeded runs
+    produce the same suite and the same reports regardless of `jobs`.
 
-        # Create iterator from list
-        bytecode_source = iter(test_list)
-    else:
-        # Probabilistic generators - use generator function
-        generator_func = GENERATORS.get(generator, generate_random_bytes)
+    Args:
+        impls: Implementations to test (default: all available)
+        (other arguments as for run_fuzzer)
 
-        # For probabilistic generators, default to 1000 tests
-        if num_tests is None:
-            num_tests = 1000
+    Returns:
+        Mapping of implementation name to its FuzzingStatistics
+
+    Raises:
+        ValueError: If an implementation is unknown, before anything runs
+    """
+    if seed is not None:
+        random.seed(seed)
 
-        # Create generator that calls generator_func num_tests times
-        bytecode_source = (generator_func() for _ in range(num_tests))
+    if impls is None:
+        impls = get_available_versions()
+    # Fail on an unknown or broken implementation before generating the suite
+    for impl in impls:
+        get_implementation(impl)
 
-    # Print header
-    print_header(num_tests, impl, generator)
+    bytecodes = generate_programs(num_tests, generator, max_expr_depth)
 
-    # Run tests (common loop for both enumeration and probabilistic)
-    for i, bytecode in enumerate(bytecode_source, 1):
-        spec_result, impl_result, matches = run_single_test(
-            bytecode, execute_with_spec, impl_func
-        )
-        stats.record_test(spec_result, impl_result, matches)
-        if not matches:
-            report_bug(i, bytecode, spec_result, impl_result)
+    with ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else contextlib.nullcontext() as pool:
+        spec_results = None
+        if len(impls) > 1:
+            spec_results = [
+                result
+                for chunk_results in execute_in_chunks(pool, execute_batch_with_spec, bytecodes)
+                for result in chunk_results
+            ]
 
-    # Print summary
-    stats.print_summary()
-    return stats
+        return {
+            impl: check_implementation(bytecodes, spec_results, impl, generator, pool)
+            for impl in impls
+        }
 
 
 # =============================================================================
@@ -473,6 +701,13 @@ def run_fuzzer(
 if __name__ == "__main__":
     import argparse
 
+    def positive_int(value: str) -> int:
+        """argparse type for counts that must be at least 1."""
+        number = int(value)
+        if number < 1:
+            raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+        return number
+
     parser = argparse.ArgumentParser(description="Fuzzer for SloppyVM")
     parser.add_argument(
         "-n", "--num-tests",
@@ -491,8 +726,9 @@ if __name__ == "__main__":
         "-i", "--impl",
         type=str,
         default=get_available_versions()[0],
-        choices=get_available_versions(),
-        help=f"Implementation to test. Available: {', '.join(get_available_versions())} (default: %(default)s)"
+        choices=[*get_available_versions(), "all"],
+        help=f"Implementation to test, or 'all' to run one suite against every implementation. "
+             f"Available: {', '.join(get_available_versions())} (default: %(default)s)"
     )
     parser.add_argument(
         "-g", "--generator",
@@ -510,13 +746,20 @@ if __name__ == "__main__":
              "Suite size grows exponentially: depth 0 (~8 tests), depth 1 (~266 tests), "
              "depth 2 (~120K tests), depth 3 (~15M tests). Ignored for other generators."
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=positive_int,
+        default=1,
+        help="Number of worker processes used to execute tests (default: 1)"
+    )
 
     args = parser.parse_args()
 
-    run_fuzzer(
+    run_fuzzer_all(
         num_tests=args.num_tests,
         seed=args.seed,
-        impl=args.impl,
+        impls=None if args.impl == "all" else [args.impl],
         generator=args.generator,
-        max_expr_depth=args.max_expr_depth
+        max_expr_depth=args.max_expr_depth,
+        jobs=args.jobs
     )
@@ -14,6 +14,66 @@ from typing import List
 from sloppyvm.spec import UINT64_MAX, OP_PUSH4, OP_ADD, OP_MUL, OP_BYTE
 
 
+# =============================================================================
+# Opcode Handlers
+# =============================================================================
+# Each handler executes one instruction at `offset` and returns the offset of
+# the next instruction.
+
+def _op_push4(stack: List[int], bytecode: bytes, offset: int) -> int:
+    # BUG: Using little-endian instead of big-endian
+    # BUG: No bounds checking for buffer size
+    value = int.from_bytes(bytecode[offset + 1:offset + 5], 'little')
+    stack.append(value)
+    return offset + 5
+
+
+def _op_add(stack: List[int], bytecode: bytes, offset: int) -> int:
+    # BUG: No stack underflow checking
+    a = stack.pop()
+    b = stack.pop()
+    # BUG: Missing modulo masking for overflow
+    stack.append(a + b)
+    return offset + 1
+
+
+def _op_mul(stack: List[int], bytecode: bytes, offset: int) -> int:
+    # BUG: No stack underflow checking
+    a = stack.pop()
+    b = stack.pop()
+    # BUG: Missing modulo masking for overflow
+    stack.append(a * b)
+    return offset + 1
+
+
+def _op_byte(stack: List[int], bytecode: bytes, offset: int) -> int:
+    # BUG: No stack underflow checking
+    # BUG: wrong stack pop order
+    x = stack.pop()
+    i = stack.pop()
+    # BUG: wrong bound check
+    if i >= 7:
+        stack.append(0)
+    else:
+        shift = i * 8  # BUG: should be (7-i) * 8
+        result = (x >> shift) & 0xFF
+        stack.append(result)
+    return offset + 1
+
+
+def _op_invalid(stack: List[int], bytecode: bytes, offset: int) -> int:
+    # BUG: Unknown opcodes will crash instead of raising error
+    raise RuntimeError(f"Unknown opcode: 0x{bytecode[offset]:02X}")
+
+
+# Opcode -> handler table, indexed directly by the opcode byte
+DISPATCH = [_op_invalid] * 256
+DISPATCH[OP_PUSH4] = _op_push4
+DISPATCH[OP_ADD] = _op_add
+DISPATCH[OP_MUL] = _op_mul
+DISPATCH[OP_BYTE] = _op_byte
+
+
 def execute(bytecode: bytes) -> List[int]:
     """
     Execute bytecode and return the final stack state.
@@ -33,50 +93,10 @@ def execute(bytecode: bytes) -> List[int]:
     """
     stack: List[int] = []
     offset = 0
+    n = len(bytecode)
+    dispatch = DISPATCH
 
-    while offset < len(bytecode):
-        opcode = bytecode[offset]
-
-        if opcode == OP_PUSH4:
-            # BUG: Using little-endian instead of big-endian
-            # BUG: No bounds checking for buffer size
-            value = int.from_bytes(bytecode[offset + 1:offset + 5], 'little')
-            stack.append(value)
-            offset += 5
-
-        elif opcode == OP_ADD:
-            # BUG: No stack underflow checking
-            a = stack.pop()
-            b = stack.pop()
-            # BUG: Missing modulo masking for overflow
-            stack.append(a + b)
-            offset += 1
-
-        elif opcode == OP_MUL:
-            # BUG: No stack underflow checking
-            a = stack.pop()
-            b = stack.pop()
-            # BUG: Missing modulo masking for overflow
-            stack.append(a * b)
-            offset += 1
-
-        elif opcode == OP_BYTE:
-            # BUG: No stack underflow checking
-            # BUG: wrong stack pop order
-            x = stack.pop()
-            i = stack.pop()
-            # BUG: wrong bound check
-            if i >= 7:
-                stack.append(0)
-            else:
-                shift = i * 8  # BUG: should be (7-i) * 8
-                result = (x >> shift) & 0xFF
-                stack.append(result)
-            offset += 1
-
-        else:
-            # BUG: Unknown opcodes will crash instead of raising error
-            raise RuntimeError(f"Unknown opcode: 0x{opcode:02X}")
+    while offset < n:
+        offset = dispatch[bytecode[offset]](stack, bytecode, offset)
 
     return stack
-
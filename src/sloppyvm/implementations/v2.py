@@ -10,6 +10,7 @@ Known issues:
   * Incorrect BYTE indexing (uses `i * 8` instead of `(7-i) * 8`)
 """
 
+from struct import Struct
 from typing import List, Optional
 
 from sloppyvm.spec import (
@@ -17,6 +18,72 @@ from sloppyvm.spec import (
     UINT64_MAX, OP_PUSH4, OP_ADD, OP_MUL, OP_BYTE
 )
 
+# Big-endian u32 decoder for PUSH4 operands; reads in place, no slice copy
+_unpack_u32 = Struct('>I').unpack_from
+
+
+# =============================================================================
+# Opcode Handlers
+# =============================================================================
+# Each handler executes one instruction at `offset` and returns the offset of
+# the next instruction. ADD and MUL pop one operand and overwrite the other in
+# place with the result, rather than popping both and appending.
+
+def _op_push4(stack: List[int], bytecode: bytes, offset: int) -> int:
+    if offset + 5 > len(bytecode):
+        raise InvalidInstruction(
+            f"Truncated PUSH4 at offset {offset}: need 5 bytes, have {len(bytecode) - offset}"
+        )
+    stack.append(_unpack_u32(bytecode, offset + 1)[0])
+    return offset + 5
+
+
+def _op_add(stack: List[int], bytecode: bytes, offset: int) -> int:
+    if len(stack) < 2:
+        raise StackUnderflow("ADD requires 2 stack elements")
+    a = stack.pop()
+    # BUG: Missing modulo masking for overflow
+    stack[-1] = a + stack[-1]
+    return offset + 1
+
+
+def _op_mul(stack: List[int], bytecode: bytes, offset: int) -> int:
+    if len(stack) < 2:
+        raise StackUnderflow("MUL requires 2 stack elements")
+    a = stack.pop()
+    # BUG: Missing modulo masking for overflow
+    stack[-1] = a * stack[-1]
+    return offset + 1
+
+
+def _op_byte(stack: List[int], bytecode: bytes, offset: int) -> int:
+    if len(stack) < 2:
+        raise StackUnderflow("BYTE requires 2 stack elements")
+    # BUG: wrong stack pop order
+    x = stack.pop()
+    i = stack.pop()
+    # BUG: wrong bound check
+    if i >= 7:
+        stack.append(0)
+    else:
+        shift = i * 8  # BUG: should be (7-i) * 8
+        result = (x >> shift) & 0xFF
+        stack.append(result)
+    return offset + 1
+
+
+def _op_invalid(stack: List[int], bytecode: bytes, offset: int) -> int:
+    # IMPROVEMENT: Raise custom exception instead of generic RuntimeError
+    raise InvalidInstruction(f"Unknown opcode: 0x{bytecode[offset]:02X} at offset {offset}")
+
+
+# Opcode -> handler table, indexed directly by the opcode byte
+DISPATCH = [_op_invalid] * 256
+DISPATCH[OP_PUSH4] = _op_push4
+DISPATCH[OP_ADD] = _op_add
+DISPATCH[OP_MUL] = _op_mul
+DISPATCH[OP_BYTE] = _op_byte
+
 
 def execute(bytecode: bytes) -> List[int]:
     """
@@ -34,54 +101,10 @@ def execute(bytecode: bytes) -> List[int]:
     """
     stack: List[int] = []
     offset = 0
+    n = len(bytecode)
+    dispatch = DISPATCH
 
-    while offset < len(bytecode):
-        opcode = bytecode[offset]
-
-        if opcode == OP_PUSH4:
-            if offset + 5 > len(bytecode):
-                raise InvalidInstruction(
-                    f"Truncated PUSH4 at offset {offset}: need 5 bytes, have {len(bytecode) - offset}"
-                )
-            value = int.from_bytes(bytecode[offset + 1:offset + 5], 'big')
-            stack.append(value)
-            offset += 5
-
-        elif opcode == OP_ADD:
-            if len(stack) < 2:
-                raise StackUnderflow("ADD requires 2 stack elements")
-            a = stack.pop()
-            b = stack.pop()
-            # BUG: Missing modulo masking for overflow
-            stack.append(a + b)
-            offset += 1
-
-        elif opcode == OP_MUL:
-            if len(stack) < 2:
-                raise StackUnderflow("MUL requires 2 stack elements")
-            a = stack.pop()
-            b = stack.pop()
-            # BUG: Missing modulo masking for overflow
-            stack.append(a * b)
-            offset += 1
-
-        elif opcode == OP_BYTE:
-            if len(stack) < 2:
-                raise StackUnderflow("BYTE requires 2 stack elements")
-            # BUG: wrong stack pop order
-            x = stack.pop()
-            i = stack.pop()
-            # BUG: wrong bound check
-            if i >= 7:
-                stack.append(0)
-            else:
-                shift = i * 8  # BUG: should be (7-i) * 8
-                result = (x >> shift) & 0xFF
-                stack.append(result)
-            offset += 1
-
-        else:
-            # IMPROVEMENT: Raise custom exception instead of generic RuntimeError
-            raise InvalidInstruction(f"Unknown opcode: 0x{opcode:02X} at offset {offset}")
+    while offset < n:
+        offset = dispatch[bytecode[offset]](stack, bytecode, offset)
 
     return stack
@@ -7,6 +7,7 @@ This version fixes all known bugs from v1/v2:
 - Fixed: Wrong stack pop order for BYTE
 """
 
+from struct import Struct, error as StructError
 from typing import List, Optional
 
 from sloppyvm.spec import (
@@ -14,6 +15,93 @@ from sloppyvm.spec import (
     UINT64_MAX, OP_PUSH4, OP_ADD, OP_MUL, OP_BYTE
 )
 
+# Big-endian u32 decoder for PUSH4 operands; reads in place, no slice copy
+_unpack_u32 = Struct('>I').unpack_from
+# Decodes the operands of `PUSH4 a; PUSH4 b`, skipping the second opcode byte
+_unpack_u32_pair = Struct('>IxI').unpack_from
+
+
+# =============================================================================
+# Opcode Handlers
+# =============================================================================
+# Each handler executes one instruction at `offset` and returns the offset of
+# the next instruction. Binary operations pop one operand and overwrite the
+# other in place with the result, rather than popping both and appending.
+
+def _op_push4(stack: List[int], bytecode: bytes, offset: int) -> int:
+    # The bounds check is left to the decoder: entering the try block is
+    # free, and only a truncated operand pays for the exception.
+    try:
+        value = _unpack_u32(bytecode, offset + 1)[0]
+    except StructError:
+        raise InvalidInstruction(
+            f"Truncated PUSH4 at offset {offset}: need 5 bytes, have {len(bytecode) - offset}"
+        ) from None
+
+    # Super-instructions: `PUSH4 a; PUSH4 b; ADD|MUL` (about half of the
+    # instructions in expression-generated programs) runs in one dispatch.
+    # Both operands are u32, so neither result can exceed 64 bits.
+    if offset + 11 <= len(bytecode) and bytecode[offset + 5] == OP_PUSH4:
+        next_op = bytecode[offset + 10]
+        if next_op == OP_ADD:
+            a, b = _unpack_u32_pair(bytecode, offset + 1)
+            stack.append(a + b)
+            return offset + 11
+        if next_op == OP_MUL:
+            a, b = _unpack_u32_pair(bytecode, offset + 1)
+            stack.append(a * b)
+            return offset + 11
+
+    stack.append(value)
+    return offset + 5
+
+
+def _op_add(stack: List[int], bytecode: bytes, offset: int) -> int:
+    if len(stack) < 2:
+        raise StackUnderflow("ADD requires 2 stack elements")
+    a = stack.pop()
+    # FIXED: Added modulo masking for overflow
+    stack[-1] = (a + stack[-1]) & UINT64_MAX
+    return offset + 1
+
+
+def _op_mul(stack: List[int], bytecode: bytes, offset: int) -> int:
+    if len(stack) < 2:
+        raise StackUnderflow("MUL requires 2 stack elements")
+    a = stack.pop()
+    # FIXED: Added modulo masking for overflow
+    stack[-1] = (a * stack[-1]) & UINT64_MAX
+    return offset + 1
+
+
+def _op_byte(stack: List[int], bytecode: bytes, offset: int) -> int:
+    if len(stack) < 2:
+        raise StackUnderflow("BYTE requires 2 stack elements")
+    # FIXED: wrong stack pop order
+    i = stack.pop()
+    x = stack[-1]
+    # BUG: wrong bound check
+    if i >= 7:
+        stack[-1] = 0
+    else:
+        # FIXED: Use (7-i) for big-endian indexing (0=MSB, 7=LSB)
+        shift = (7 - i) * 8
+        result = (x >> shift) & 0xFF
+        stack[-1] = result
+    return offset + 1
+
+
+def _op_invalid(stack: List[int], bytecode: bytes, offset: int) -> int:
+    raise InvalidInstruction(f"Unknown opcode: 0x{bytecode[offset]:02X} at offset {offset}")
+
+
+# Opcode -> handler table, indexed directly by the opcode byte
+DISPATCH = [_op_invalid] * 256
+DISPATCH[OP_PUSH4] = _op_push4
+DISPATCH[OP_ADD] = _op_add
+DISPATCH[OP_MUL] = _op_mul
+DISPATCH[OP_BYTE] = _op_byte
+
 
 def execute(bytecode: bytes) -> List[int]:
     """
@@ -31,54 +119,10 @@ def execute(bytecode: bytes) -> List[int]:
     """
     stack: List[int] = []
     offset = 0
+    n = len(bytecode)
+    dispatch = DISPATCH
 
-    while offset < len(bytecode):
-        opcode = bytecode[offset]
-
-        if opcode == OP_PUSH4:
-            if offset + 5 > len(bytecode):
-                raise InvalidInstruction(
-                    f"Truncated PUSH4 at offset {offset}: need 5 bytes, have {len(bytecode) - offset}"
-                )
-            value = int.from_bytes(bytecode[offset + 1:offset + 5], 'big')
-            stack.append(value)
-            offset += 5
-
-        elif opcode == OP_ADD:
-            if len(stack) < 2:
-                raise StackUnderflow("ADD requires 2 stack elements")
-            a = stack.pop()
-            b = stack.pop()
-            # FIXED: Added modulo masking for overflow
-            stack.append((a + b) & UINT64_MAX)
-            offset += 1
-
-        elif opcode == OP_MUL:
-            if len(stack) < 2:
-                raise StackUnderflow("MUL requires 2 stack elements")
-            a = stack.pop()
-            b = stack.pop()
-            # FIXED: Added modulo masking for overflow
-            stack.append((a * b) & UINT64_MAX)
-            offset += 1
-
-        elif opcode == OP_BYTE:
-            if len(stack) < 2:
-                raise StackUnderflow("BYTE requires 2 stack elements")
-            # FIXED: wrong stack pop order
-            i = stack.pop()
-            x = stack.pop()
-            # BUG: wrong bound check
-            if i >= 7:
-                stack.append(0)
-            else:
-                # FIXED: Use (7-i) for big-endian indexing (0=MSB, 7=LSB)
-                shift = (7 - i) * 8
-                result = (x >> shift) & 0xFF
-                stack.append(result)
-            offset += 1
-
-        else:
-            raise InvalidInstruction(f"Unknown opcode: 0x{opcode:02X} at offset {offset}")
+    while offset < n:
+        offset = dispatch[bytecode[offset]](stack, bytecode, offset)
 
     return stack
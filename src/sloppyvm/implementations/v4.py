@@ -8,6 +8,7 @@ This version fixes all known bugs from v1/v2/v3:
 - Fixed: Wrong bound check (now uses `i >= 8` instead of `i >= 7`)
 """
 
+from struct import Struct
 from typing import List, Optional
 
 from sloppyvm.spec import (
@@ -15,6 +16,73 @@ from sloppyvm.spec import (
     UINT64_MAX, OP_PUSH4, OP_ADD, OP_MUL, OP_BYTE
 )
 
+# Big-endian u32 decoder for PUSH4 operands; reads in place, no slice copy
+_unpack_u32 = Struct('>I').unpack_from
+
+
+# =============================================================================
+# Opcode Handlers
+# =============================================================================
+# Each handler executes one instruction at `offset` and returns the offset of
+# the next instruction.
+
+def _op_push4(stack: List[int], bytecode: bytes, offset: int) -> int:
+    if offset + 5 > len(bytecode):
+        raise InvalidInstruction(
+            f"Truncated PUSH4 at offset {offset}: need 5 bytes, have {len(bytecode) - offset}"
+        )
+    value = _unpack_u32(bytecode, offset + 1)[0]
+    stack.append(value)
+    return offset + 5
+
+
+def _op_add(stack: List[int], bytecode: bytes, offset: int) -> int:
+    if len(stack) < 2:
+        raise StackUnderflow("ADD requires 2 stack elements")
+    a = stack.pop()
+    b = stack.pop()
+    # FIXED: Added modulo masking for overflow
+    stack.append((a + b) & UINT64_MAX)
+    return offset + 1
+
+
+def _op_mul(stack: List[int], bytecode: bytes, offset: int) -> int:
+    if len(stack) < 2:
+        raise StackUnderflow("MUL requires 2 stack elements")
+    a = stack.pop()
+    b = stack.pop()
+    # FIXED: Added modulo masking for overflow
+    stack.append((a * b) & UINT64_MAX)
+    return offset + 1
+
+
+def _op_byte(stack: List[int], bytecode: bytes, offset: int) -> int:
+    if len(stack) < 2:
+        raise StackUnderflow("BYTE requires 2 stack elements")
+    # FIXED: wrong stack pop order
+    i = stack.pop()
+    x = stack.pop()
+    # FIXED: wrong bound check (was i >= 7, now i >= 8)
+    # Branchless: the mask is 0xFF for i < 8 and 0 otherwise, so an
+    # out-of-range index yields 0 without a separate code path.
+    mask = -(i < 8) & 0xFF
+    # FIXED: Use (7-i) for big-endian indexing (0=MSB, 7=LSB)
+    shift = (7 - (i & 7)) * 8
+    stack.append((x >> shift) & mask)
+    return offset + 1
+
+
+def _op_invalid(stack: List[int], bytecode: bytes, offset: int) -> int:
+    raise InvalidInstruction(f"Unknown opcode: 0x{bytecode[offset]:02X} at offset {offset}")
+
+
+# Opcode -> handler table, indexed directly by the opcode byte
+DISPATCH = [_op_invalid] * 256
+DISPATCH[OP_PUSH4] = _op_push4
+DISPATCH[OP_ADD] = _op_add
+DISPATCH[OP_MUL] = _op_mul
+DISPATCH[OP_BYTE] = _op_byte
+
 
 def execute(bytecode: bytes) -> List[int]:
     """
@@ -32,54 +100,10 @@ def execute(bytecode: bytes) -> List[int]:
     """
     stack: List[int] = []
     offset = 0
+    n = len(bytecode)
+    dispatch = DISPATCH
 
-    while offset < len(bytecode):
-        opcode = bytecode[offset]
-
-        if opcode == OP_PUSH4:
-            if offset + 5 > len(bytecode):
-                raise InvalidInstruction(
-                    f"Truncated PUSH4 at offset {offset}: need 5 bytes, have {len(bytecode) - offset}"
-                )
-            value = int.from_bytes(bytecode[offset + 1:offset + 5], 'big')
-            stack.append(value)
-            offset += 5
-
-        elif opcode == OP_ADD:
-            if len(stack) < 2:
-                raise StackUnderflow("ADD requires 2 stack elements")
-            a = stack.pop()
-            b = stack.pop()
-            # FIXED: Added modulo masking for overflow
-            stack.append((a + b) & UINT64_MAX)
-            offset += 1
-
-        elif opcode == OP_MUL:
-            if len(stack) < 2:
-                raise StackUnderflow("MUL requires 2 stack elements")
-            a = stack.pop()
-            b = stack.pop()
-            # FIXED: Added modulo masking for overflow
-            stack.append((a * b) & UINT64_MAX)
-            offset += 1
-
-        elif opcode == OP_BYTE:
-            if len(stack) < 2:
-                raise StackUnderflow("BYTE requires 2 stack elements")
-            # FIXED: wrong stack pop order
-            i = stack.pop()
-            x = stack.pop()
-            # FIXED: wrong bound check (was i >= 7, now i >= 8)
-            if i >= 8:
-                stack.append(0)
-            else:
-                # FIXED: Use (7-i) for big-endian indexing (0=MSB, 7=LSB)
-                shift = (7 - i) * 8
-                result = (x >> shift) & 0xFF
-                stack.append(result)
-            offset += 1
-
-        else:
-            raise InvalidInstruction(f"Unknown opcode: 0x{opcode:02X} at offset {offset}")
+    while offset < n:
+        offset = dispatch[bytecode[offset]](stack, bytecode, offset)
 
     return stack
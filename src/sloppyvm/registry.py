@@ -1,10 +1,12 @@
 """Dynamic discovery and registry of SloppyVM implementation modules.
 
 Searches for files matching the pattern 'v*.py' in the implementations/
-subdirectory, imports them, and validates they have the required
-execute() function.
+subdirectory. Each module is imported, and validated to have the required
+execute() function, the first time its version is requested. Listing the
+available versions imports and validates all of them, skipping broken ones.
 """
 
+import functools
 import importlib
 import pathlib
 import re
@@ -23,22 +25,22 @@ def is_valid_implementation(module: ModuleType) -> bool:
     return hasattr(module, 'execute') and callable(module.execute)
 
 
-def discover_implementations() -> dict[str, tuple[ModuleType, int]]:
+def find_implementation_files() -> dict[str, pathlib.Path]:
     """
-    Dynamically discover all SloppyVM implementation modules.
+    Find SloppyVM implementation files without importing them.
 
     Searches for files matching the pattern 'v*.py' in the implementations/
-    subdirectory, imports them, and validates they have the required
-    execute() function.
+    subdirectory and adds that directory to the module search path, so
+    get_implementation() can import them on first use.
 
     Returns:
-        Dictionary mapping version identifiers (e.g., 'v1', 'v2') to tuples
-        of (module, version_number). Sorted by version number ascending.
+        Dictionary mapping version identifiers (e.g., 'v1', 'v2') to file
+        paths. Sorted by version number ascending.
 
     Raises:
-        RuntimeError: If no valid implementations are found
+        RuntimeError: If no implementation files are found
     """
-    implementations: dict[str, tuple[ModuleType, int]] = {}
+    paths: dict[int, pathlib.Path] = {}
     script_dir = pathlib.Path(__file__).parent.resolve()
     impl_dir = script_dir / 'implementations'
 
@@ -47,36 +49,71 @@ def discover_implementations() -> dict[str, tuple[ModuleType, int]]:
 
     for file_path in impl_dir.glob('v*.py'):
         version_num = extract_version_from_filename(file_path.name)
-        if version_num is None:
-            continue
+        if version_num is not None:
+            paths[version_num] = file_path
+
+    if not paths:
+        raise RuntimeError("No SloppyVM implementation files found")
 
-        module_name = file_path.stem
-        version_key = f'v{version_num}'
+    return {f'v{version_num}': paths[version_num] for version_num in sorted(paths)}
 
+
+def discover_implementations() -> dict[str, tuple[ModuleType, int]]:
+    """
+    Import and validate all SloppyVM implementation modules.
+
+    Implementations that fail to import or have no execute() function are
+    skipped with a warning.
+
+    Returns:
+        Dictionary mapping version identifiers (e.g., 'v1', 'v2') to tuples
+        of (module, version_number). Sorted by version number ascending.
+
+    Raises:
+        RuntimeError: If no valid implementations are found
+    """
+    implementations: dict[str, tuple[ModuleType, int]] = {}
+
+    for version_key, file_path in _IMPLEMENTATION_PATHS.items():
         try:
-            module = importlib.import_module(module_name)
-            if is_valid_implementation(module):
-                implementations[version_key] = (module, version_num)
+            module = get_implementation(version_key)
         except Exception as e:
-            print(f"Warning: Failed to import {module_name}: {e} - skipping", file=sys.stderr)
+            print(f"Warning: Failed to import {file_path.stem}: {e} - skipping", file=sys.stderr)
+            continue
+        implementations[version_key] = (module, extract_version_from_filename(file_path.name))
 
     if not implementations:
         raise RuntimeError("No valid SloppyVM implementations found")
 
-    return dict(sorted(implementations.items(), key=lambda x: x[1][1]))
+    return implementations
+
+
+# Only the file scan happens at import time; modules are imported on first
+# get_implementation() call, so CLI startup does not load every version
+_IMPLEMENTATION_PATHS = find_implementation_files()
+_MODULE_CACHE: dict[str, ModuleType] = {}
 
 
-_IMPLEMENTATION_REGISTRY = discover_implementations()
+@functools.cache
+def _valid_versions() -> tuple[str, ...]:
+    # Cached so broken implementations are reported only once
+    return tuple(discover_implementations())
 
 
 def get_available_versions() -> list[str]:
-    """Return sorted list of available implementation version identifiers."""
-    return list(_IMPLEMENTATION_REGISTRY.keys())
+    """
+    Return sorted list of available implementation version identifiers.
+
+    Only implementations that import and have a callable execute() are
+    listed; the first call imports every implementation to check this.
+    """
+    return list(_valid_versions())
 
 
 def get_implementation(version: str) -> ModuleType:
     """
-    Get the implementation module for a given version.
+    Get the implementation module for a given version, importing it on
+    first use.
 
     Args:
         version: Version identifier (e.g., 'v1', 'v2')
@@ -85,9 +122,16 @@ def get_implementation(version: str) -> ModuleType:
         The implementation module
 
     Raises:
-        ValueError: If version is not found
+        ValueError: If version is not found or has no callable execute()
     """
-    if version in _IMPLEMENTATION_REGISTRY:
-        return _IMPLEMENTATION_REGISTRY[version][0]
-    available = ', '.join(get_available_versions())
-    raise ValueError(f"Unknown implementation: {version}. Available: {available}")
+    if version in _MODULE_CACHE:
+        return _MODULE_CACHE[version]
+    if version not in _IMPLEMENTATION_PATHS:
+        available = ', '.join(get_available_versions())
+        raise ValueError(f"Unknown implementation: {version}. Available: {available}")
+
+    module = importlib.import_module(_IMPLEMENTATION_PATHS[version].stem)
+    if not is_valid_implementation(module):
+        raise ValueError(f"Implementation {version} has no callable execute() function")
+    _MODULE_CACHE[version] = module
+    return module
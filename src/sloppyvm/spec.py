@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import Union, List, Optional, Tuple
+from struct import Struct
+from typing import Union, List, NoReturn, Optional, Tuple
 
 # =============================================================================
 # Constants
@@ -17,7 +18,7 @@ OP_BYTE  = 0x04
 # Instruction ADT
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PUSH4:
     """Push a 4-byte (32-bit) value onto the stack."""
     value: int
@@ -26,23 +27,36 @@ class PUSH4:
         if not (0 <= self.value <= 0xFFFFFFFF):
             raise ValueError(f"PUSH4 value must be 0-0xFFFFFFFF, got {self.value}")
 
-@dataclass(frozen=True)
+    @classmethod
+    def unchecked(cls, value: int) -> 'PUSH4':
+        """Construct without the range check, for values known to fit in 32 bits."""
+        instr = cls.__new__(cls)
+        object.__setattr__(instr, 'value', value)
+        return instr
+
+@dataclass(frozen=True, slots=True)
 class ADD:
     """Pop two values, push their sum (mod 2^64)."""
     pass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MUL:
     """Pop two values, push their product (mod 2^64)."""
     pass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BYTE:
     """Extract byte from value at given index."""
     pass
 
 Instruction = Union[PUSH4, ADD, MUL, BYTE]
 
+# The operand-free instructions are immutable and carry no state, so the
+# decoder hands out one shared instance of each instead of allocating
+_ADD = ADD()
+_MUL = MUL()
+_BYTE = BYTE()
+
 # =============================================================================
 # Serialization (Instructions -> Bytes)
 # =============================================================================
@@ -97,6 +111,9 @@ class StackUnderflow(SloppyVMException):
 # Deserialization (Bytes -> Instructions)
 # =============================================================================
 
+# Big-endian u32 decoder for PUSH4 operands; reads in place, no slice copy
+_unpack_u32 = Struct('>I').unpack_from
+
 
 def deserialize_instruction(data: bytes, offset: int = 0) -> Tuple[Instruction, int]:
     """
@@ -125,17 +142,18 @@ def deserialize_instruction(data: bytes, offset: int = 0) -> Tuple[Instruction,
                 raise InvalidInstruction(
                     f"Truncated PUSH4 at offset {offset}: need 5 bytes, have {len(data) - offset}"
                 )
-            value = int.from_bytes(data[offset + 1:offset + 5], 'big')
-            return PUSH4(value), offset + 5
+            # Four bytes always decode to a valid u32, so skip the range check
+            value = _unpack_u32(data, offset + 1)[0]
+            return PUSH4.unchecked(value), offset + 5
 
         case _ if opcode == OP_ADD:
-            return ADD(), offset + 1
+            return _ADD, offset + 1
 
         case _ if opcode == OP_MUL:
-            return MUL(), offset + 1
+            return _MUL, offset + 1
 
         case _ if opcode == OP_BYTE:
-            return BYTE(), offset + 1
+            return _BYTE, offset + 1
         
         case _:
             raise InvalidInstruction(f"Unknown opcode 0x{opcode:02X} at offset {offset}")
@@ -154,17 +172,35 @@ def deserialize_program(data: bytes) -> List[Instruction]:
     Raises:
         InvalidInstruction: If bytecode is invalid
     """
-    instructions = []
+    instructions: List[Instruction] = []
+    append = instructions.append
     offset = 0
-    
-    while offset < len(data):
-        instr, offset = deserialize_instruction(data, offset)
-        instructions.append(instr)
-    
+    n = len(data)
+
+    # Decoding is inlined for the valid cases; anything else is handed to
+    # deserialize_instruction, which raises the appropriate error
+    while offset < n:
+        opcode = data[offset]
+        if opcode == OP_PUSH4 and offset + 5 <= n:
+            append(PUSH4.unchecked(_unpack_u32(data, offset + 1)[0]))
+            offset += 5
+        elif opcode == OP_ADD:
+            append(_ADD)
+            offset += 1
+        elif opcode == OP_MUL:
+            append(_MUL)
+            offset += 1
+        elif opcode == OP_BYTE:
+            append(_BYTE)
+            offset += 1
+        else:
+            instr, offset = deserialize_instruction(data, offset)
+            append(instr)
+
     return instructions
 
 # =============================================================================
-# VM State and Execution (unchanged from before)
+# VM State and Execution
 # =============================================================================
 
 @dataclass
@@ -176,60 +212,143 @@ class VMState:
             if not (0 <= val <= UINT64_MAX):
                 raise ValueError(f"Stack value at {i} out of uint64 range: {val}")
     
+    @classmethod
+    def unchecked(cls, stack: List[int]) -> 'VMState':
+        """Construct without the range check, for stacks known to be valid."""
+        state = cls.__new__(cls)
+        state.stack = stack
+        return state
+
     def copy(self) -> 'VMState':
-        return VMState(stack=self.stack.copy())
+        # Values already in a VMState were validated (or produced masked)
+        return VMState.unchecked(self.stack.copy())
+
+
+# Per-instruction handlers, each mutating the stack in place
+
+def _exec_add(stack: List[int]) -> None:
+    if len(stack) < 2:
+        raise StackUnderflow("ADD requires 2 stack elements")
+    a = stack.pop()
+    b = stack.pop()
+    stack.append((a + b) & UINT64_MAX)
+
+
+def _exec_mul(stack: List[int]) -> None:
+    if len(stack) < 2:
+        raise StackUnderflow("MUL requires 2 stack elements")
+    a = stack.pop()
+    b = stack.pop()
+    stack.append((a * b) & UINT64_MAX)
+
+
+def _exec_byte(stack: List[int]) -> None:
+    if len(stack) < 2:
+        raise StackUnderflow("BYTE requires 2 stack elements")
+    i = stack.pop()
+    x = stack.pop()
+    if i >= 8:
+        stack.append(0)
+    else:
+        # Byte i of the big-endian 64-bit value (0 = MSB)
+        stack.append((x >> ((7 - i) * 8)) & 0xFF)
+
+
+def _exec_unknown(instruction: Instruction) -> None:
+    raise InvalidInstruction(f"Unknown instruction type: {instruction}")
 
 
 def execute(state: VMState, instruction: Instruction) -> VMState:
-    new_state = state.copy()
-    stack = new_state.stack
+    """
+    Execute one instruction, mutating `state` in place, and return it.
 
-    match instruction:
-        case PUSH4(value=val):
-            stack.append(val)
-            return new_state
+    Use execute_copy() to leave the input state untouched.
+    """
+    # Checked in order of frequency; PUSH4 is about half of all instructions
+    t = type(instruction)
+    if t is PUSH4:
+        state.stack.append(instruction.value)
+    elif t is ADD:
+        _exec_add(state.stack)
+    elif t is MUL:
+        _exec_mul(state.stack)
+    elif t is BYTE:
+        _exec_byte(state.stack)
+    else:
+        _exec_unknown(instruction)
+    return state
 
-        case ADD():
-            if len(stack) < 2:
-                raise StackUnderflow("ADD requires 2 stack elements")
-            a = stack.pop()
-            b = stack.pop()
-            stack.append((a + b) & UINT64_MAX)
-            return new_state
 
-        case MUL():
+def execute_copy(state: VMState, instruction: Instruction) -> VMState:
+    """Execute one instruction on a copy of `state`, returning the new state."""
+    return execute(state.copy(), instruction)
+
+
+def execute_program(instructions: List[Instruction], initial_stack: Optional[List[int]] = None) -> VMState:
+    # One state for the whole run; the caller's initial stack is copied once
+    state = VMState(stack=list(initial_stack or []))
+    for instr in instructions:
+        execute(state, instr)
+    return state
+
+
+def _raise_decode_error(code: bytes, offset: int) -> NoReturn:
+    """Raise the InvalidInstruction for the instruction at `offset`, which must not decode."""
+    deserialize_instruction(code, offset)
+    raise AssertionError(f"instruction at offset {offset} decodes, but execute_bytes cannot run it")
+
+
+def execute_bytes(code: bytes, initial_stack: Optional[List[int]] = None) -> VMState:
+    """
+    Execute bytecode in a single pass, without building Instruction objects.
+
+    Equivalent to `execute_program(deserialize_program(code), initial_stack)`,
+    including which exception is raised: the whole program must decode before
+    anything runs, so if execution fails with a stack underflow, the rest of
+    the bytecode is decoded first and any InvalidInstruction takes precedence.
+
+    The stack is a single list mutated in place; no per-instruction state
+    copies are made.
+    """
+    state = VMState(stack=list(initial_stack or []))
+    stack = state.stack
+    offset = 0
+    n = len(code)
+
+    while offset < n:
+        opcode = code[offset]
+
+        if opcode == OP_PUSH4:
+            if offset + 5 > n:
+                _raise_decode_error(code, offset)
+            stack.append(_unpack_u32(code, offset + 1)[0])
+            offset += 5
+            continue
+
+        if opcode == OP_ADD or opcode == OP_MUL or opcode == OP_BYTE:
             if len(stack) < 2:
-                raise StackUnderflow("MUL requires 2 stack elements")
+                # Decoding the whole program reports invalid bytecode first
+                deserialize_program(code)
+                name = {OP_ADD: "ADD", OP_MUL: "MUL", OP_BYTE: "BYTE"}[opcode]
+                raise StackUnderflow(f"{name} requires 2 stack elements")
             a = stack.pop()
             b = stack.pop()
-            stack.append((a * b) & UINT64_MAX)
-            return new_state
-
-        case BYTE():
-            if len(stack) < 2:
-                raise StackUnderflow("BYTE requires 2 stack elements")
-            i = stack.pop()
-            x = stack.pop()
-            if i >= 8:
-                stack.append(0)
+            if opcode == OP_ADD:
+                stack.append((a + b) & UINT64_MAX)
+            elif opcode == OP_MUL:
+                stack.append((a * b) & UINT64_MAX)
             else:
-                x_bytes = x.to_bytes(8, 'big')
-                stack.append(x_bytes[i])
-            return new_state
-
-        case _:
-            raise InvalidInstruction(f"Unknown instruction type: {instruction}")
+                # a is the index, b the value; byte 0 is the MSB
+                stack.append((b >> ((7 - a) * 8)) & 0xFF if a < 8 else 0)
+            offset += 1
+            continue
 
+        _raise_decode_error(code, offset)
 
-def execute_program(instructions: List[Instruction], initial_stack: Optional[List[int]] = None) -> VMState:
-    state = VMState(stack=initial_stack or [])
-    for instr in instructions:
-        state = execute(state, instr)
     return state
 
 
 def execute_bytecode(bytecode: bytes, initial_stack: Optional[List[int]] = None) -> VMState:
     """Convenience function to execute bytecode directly."""
-    instructions = deserialize_program(bytecode)
-    return execute_program(instructions, initial_stack)
+    return execute_bytes(bytecode, initial_stack)
 
@@ -181,19 +181,23 @@ def test_integration():
 
     from sloppyvm.registry import get_implementation
 
-    # Test finds v3 bug
-    v3 = get_implementation("v3")
+    # Generate the suite and run the spec once; both implementations are
+    # checked against the same expected stacks
     suite = list(generate_comprehensive_suite(max_expr_depth=1))
-    bugs_found = 0
+    expected = []
     for bytecode in suite:
         try:
-            spec_result = execute_bytecode(bytecode)
+            expected.append((bytecode, execute_bytecode(bytecode).stack))
         except (InvalidInstruction, StackUnderflow):
             continue
 
+    # Test finds v3 bug
+    v3 = get_implementation("v3")
+    bugs_found = 0
+    for bytecode, spec_stack in expected:
         try:
             v3_result = v3.execute(bytecode)
-            if spec_result.stack != v3_result:
+            if spec_stack != v3_result:
                 bugs_found += 1
         except Exception:
             pass
@@ -203,17 +207,11 @@ def test_integration():
 
     # Test v4 passes
     v4 = get_implementation("v4")
-    suite = list(generate_comprehensive_suite(max_expr_depth=1))
     bugs_found = 0
-    for bytecode in suite:
-        try:
-            spec_result = execute_bytecode(bytecode)
-        except (InvalidInstruction, StackUnderflow):
-            continue
-
+    for bytecode, spec_stack in expected:
         try:
             v4_result = v4.execute(bytecode)
-            if spec_result.stack != v4_result:
+            if spec_stack != v4_result:
                 bugs_found += 1
         except Exception:
             bugs_found += 1
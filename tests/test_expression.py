@@ -0,0 +1,117 @@
+"""
+Tests for the expression ADT and its compiler.
+
+Run with: uv run python tests/test_expression.py
+"""
+
+import dataclasses
+import random
+
+from sloppyvm.spec import PUSH4, ADD, MUL, BYTE, execute_bytecode
+from sloppyvm.fuzzing.expression import (
+    Const, Add, Mul, Byte,
+    compile_expr_to_instructions, compile_expr, random_expr, random_expr_bytecode,
+)
+
+
+def test_compile_expr():
+    """Tests for expression compilation."""
+    print("Expression Compilation Tests")
+    print("=" * 50)
+
+    assert compile_expr_to_instructions(Const(5)) == [PUSH4(5)]
+    print("✓ Constant")
+
+    expr = Add(Const(3), Const(4))
+    assert compile_expr_to_instructions(expr) == [PUSH4(3), PUSH4(4), ADD()]
+    print("✓ Binary operation")
+
+    expr = Mul(Const(2), Add(Const(3), Const(4)))
+    assert compile_expr_to_instructions(expr) == [
+        PUSH4(2), PUSH4(3), PUSH4(4), ADD(), MUL()
+    ]
+    print("✓ Nested right operand")
+
+    expr = Byte(Mul(Const(1), Const(2)), Add(Const(3), Const(4)))
+    assert compile_expr_to_instructions(expr) == [
+        PUSH4(1), PUSH4(2), MUL(), PUSH4(3), PUSH4(4), ADD(), BYTE()
+    ]
+    print("✓ Post-order for both operands")
+
+    # Deep left-leaning tree: (((0 + 1) + 2) + ...) + 99999, far deeper
+    # than the recursion limit
+    depth = 100_000
+    expr = Const(0)
+    for i in range(1, depth):
+        expr = Add(expr, Const(i))
+    assert execute_bytecode(compile_expr(expr)).stack == [sum(range(depth))]
+    print("✓ Deep expression compiles and evaluates")
+
+
+def test_expr_nodes():
+    """Tests for expression node construction, equality and hashing."""
+    print("Expression Node Tests")
+    print("=" * 50)
+
+    assert Add(Const(1), Const(2)) != Mul(Const(1), Const(2))
+    assert Const(1) != (1,)
+    nodes = {Add(Const(1), Const(2)), Mul(Const(1), Const(2)), Byte(Const(1), Const(2))}
+    assert len(nodes) == 3
+    assert hash(Add(Const(1), Const(2))) != hash(Mul(Const(1), Const(2)))
+    assert hash(Const(5)) != hash((5,))
+    print("✓ Node equality and hashing are type-aware")
+
+    try:
+        Add(Const(1), Const(2)) < Mul(Const(1), Const(3))
+        assert False, "expected TypeError for ordering expression nodes"
+    except TypeError:
+        pass
+    print("✓ Nodes are not ordered")
+
+    for make, error in [
+        (lambda: Const(-1), ValueError),
+        (lambda: Const(0x1_0000_0000), ValueError),
+        (lambda: Const("2"), TypeError),
+        (lambda: dataclasses.replace(Const(1), value=2**40), ValueError),
+    ]:
+        try:
+            make()
+            assert False, f"expected {error.__name__}"
+        except error:
+            pass
+    print("✓ Invalid constants are rejected")
+
+    try:
+        random_expr_bytecode(max_depth=2, const_generator=lambda: -1)
+        assert False, "expected ValueError for an out-of-range constant"
+    except ValueError:
+        pass
+    print("✓ Invalid generated constants are rejected")
+
+
+def test_random_expr_bytecode():
+    """random_expr_bytecode matches compiling random_expr for the same seed."""
+    print("Direct Expression Bytecode Tests")
+    print("=" * 50)
+
+    const_generators = [
+        lambda: random.randint(0, 0xFFFFFFFF),
+        lambda: random.randint(0, 255),
+        lambda: random.choice([*range(10), 0xFFFFFFFF]),
+    ]
+    for max_depth in (0, 1, 4, 6):
+        for const_generator in const_generators:
+            for seed in range(20):
+                random.seed(seed)
+                expected = compile_expr(random_expr(max_depth, const_generator))
+                random.seed(seed)
+                assert random_expr_bytecode(max_depth, const_generator) == expected
+    print("✓ Same bytecode as random_expr + compile_expr")
+
+
+if __name__ == "__main__":
+    test_compile_expr()
+    test_expr_nodes()
+    test_random_expr_bytecode()
+    print("\n" + "=" * 60)
+    print("All tests passed!")
@@ -0,0 +1,87 @@
+"""
+Tests for the fuzzing driver.
+
+Run with: uv run python tests/test_fuzzer.py
+"""
+
+import contextlib
+import io
+import subprocess
+import sys
+
+from sloppyvm.fuzzing.fuzzer import CHUNK_SIZE, run_fuzzer, run_fuzzer_all
+
+
+def _run_quietly(func, *args, **kwargs):
+    """Call func, returning its result and everything it printed."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = func(*args, **kwargs)
+    return result, output.getvalue()
+
+
+def test_parallel_matches_serial():
+    """Seeded runs give the same statistics and reports regardless of jobs."""
+    print("Parallel Execution Tests")
+    print("=" * 50)
+
+    # Several chunks, so chunk boundaries and ordering are exercised
+    num_tests = 2 * CHUNK_SIZE + 500
+    serial_stats, serial_output = _run_quietly(
+        run_fuzzer_all, num_tests=num_tests, seed=7, generator="mixed", jobs=1
+    )
+    parallel_stats, parallel_output = _run_quietly(
+        run_fuzzer_all, num_tests=num_tests, seed=7, generator="mixed", jobs=2
+    )
+    assert serial_stats.keys() == {"v1", "v2", "v3", "v4"}
+    assert parallel_stats == serial_stats
+    assert parallel_output == serial_output
+    assert serial_stats["v1"].bugs_found > 0
+    assert serial_stats["v4"].bugs_found == 0
+    print("✓ All implementations: same statistics and reports with jobs=1 and jobs=2")
+
+    # A single implementation runs the spec chunk by chunk rather than sharing it
+    single_stats, _ = _run_quietly(
+        run_fuzzer, num_tests=num_tests, seed=7, impl="v1", generator="mixed", jobs=2
+    )
+    assert single_stats == serial_stats["v1"]
+    print("✓ Single implementation matches the shared-spec run")
+
+
+def test_unknown_implementation():
+    """An unknown implementation is rejected before any tests are generated."""
+    print("Unknown Implementation Tests")
+    print("=" * 50)
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            run_fuzzer(num_tests=10, impl="v9")
+            assert False, "expected ValueError for an unknown implementation"
+        except ValueError:
+            pass
+    assert output.getvalue() == ""
+    print("✓ Unknown implementation fails before generation")
+
+
+def test_jobs_must_be_positive():
+    """The CLI rejects a worker count below 1."""
+    print("CLI Argument Tests")
+    print("=" * 50)
+
+    for jobs in ("0", "-2"):
+        result = subprocess.run(
+            [sys.executable, "-m", "sloppyvm.fuzzing.fuzzer", "-j", jobs, "-n", "1"],
+            capture_output=True, text=True,
+        )
+        assert result.returncode == 2
+        assert "must be at least 1" in result.stderr
+    print("✓ -j 0 and negative values are rejected")
+
+
+if __name__ == "__main__":
+    test_parallel_matches_serial()
+    test_unknown_implementation()
+    test_jobs_must_be_positive()
+    print("\n" + "=" * 60)
+    print("All tests passed!")
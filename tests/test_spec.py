@@ -11,7 +11,7 @@ from sloppyvm.spec import (
     serialize_instruction, serialize_program,
     deserialize_instruction, deserialize_program,
     # Execution
-    VMState, execute, execute_program, execute_bytecode,
+    VMState, execute, execute_copy, execute_program, execute_bytecode, execute_bytes,
     # Exceptions
     InvalidInstruction, StackUnderflow,
     # Utilities
@@ -162,6 +162,13 @@ def test_sloppy_vm():
         pass
     print("✓ Stack underflow detection")
 
+    # execute mutates the state in place; execute_copy leaves it untouched
+    state = VMState(stack=[10, 20])
+    assert execute(state, ADD()) is state and state.stack == [30]
+    state = VMState(stack=[10, 20])
+    assert execute_copy(state, ADD()).stack == [30] and state.stack == [10, 20]
+    print("✓ In-place and copying execution")
+
     # Complex program: (3 + 4) * 5 = 35
     program = [PUSH4(3), PUSH4(4), ADD(), PUSH4(5), MUL()]
     result = execute_program(program)
@@ -184,6 +191,39 @@ def test_sloppy_vm():
     print("All tests passed!")
 
 
+def test_execute_bytes():
+    """The single-pass interpreter agrees with deserialize + execute_program."""
+    print("Single-pass Execution Tests")
+    print("=" * 50)
+
+    programs = [
+        [PUSH4(3), PUSH4(4), ADD(), PUSH4(5), MUL()],
+        [PUSH4(0xFFFFFFFF), PUSH4(0xFFFFFFFF), MUL(), PUSH4(0xFFFFFFFF), MUL()],
+        [PUSH4(0x12345678), PUSH4(4), BYTE(), PUSH4(0x12345678), PUSH4(8), BYTE()],
+    ]
+    for program in programs:
+        bytecode = serialize_program(program)
+        assert execute_bytes(bytecode).stack == execute_program(program).stack
+    assert execute_bytes(serialize_program([ADD()]), [UINT64_MAX, 2]).stack == [1]
+    print("✓ Same results as execute_program")
+
+    # Invalid bytecode anywhere takes precedence over an earlier underflow,
+    # since execute_program only runs fully decoded programs
+    for bytecode, error in [
+        (bytes([0x02]), StackUnderflow),
+        (bytes([0x01, 0x00, 0x00, 0x00, 0x01, 0x02]), StackUnderflow),
+        (bytes([0x02, 0xFF]), InvalidInstruction),
+        (bytes([0x01, 0x00, 0x00, 0x00, 0x01, 0x03, 0x01, 0x00]), InvalidInstruction),
+    ]:
+        try:
+            execute_bytes(bytecode)
+            assert False, f"Should have raised {error.__name__}"
+        except error:
+            pass
+    print("✓ Same exceptions as deserialize + execute_program")
+
+
 if __name__ == "__main__":
     test_serialization()
     test_sloppy_vm()
+    test_execute_bytes()